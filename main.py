@@ -1,21 +1,22 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
-from rapidfuzz import process, fuzz
-from docxtpl import DocxTemplate, InlineImage
-from docx.shared import Cm
-from PIL import Image
+import numpy as np
+from datetime import date, datetime, timedelta
 import os
 import base64
+import functools
+import hashlib
+import hmac
+import io
+import shutil
 import re
-from docxtpl.richtext import RichText
-import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import gspread
 
 # --- CONFIGURATION ---
 MALE_TEMPLATE = "male_template.docx"
 FEMALE_TEMPLATE = "female_template.docx"
-PHOTO_DIR = "photo_uploads"
 GENERATED_DOCS_DIR = "generated_docs"
 ID_CARD_DIR = "id_card_uploads"
 LOGO_LEFT_PATH = "mmti.webp"
@@ -24,19 +25,38 @@ LOGO_RIGHT_PATH = "ntu.webp"
 try:
     EMPLOYEE_PASSWORD = st.secrets.get("passwords", {}).get("employee", "123")
     SPREADSHEET_NAME = st.secrets.get("app_config", {}).get("spreadsheet_name", "")
+    SPREADSHEET_KEY = st.secrets.get("app_config", {}).get("spreadsheet_key", "")
 except (KeyError, FileNotFoundError):
     st.error("Required secrets not found. Please configure them for deployment.")
-    EMPLOYEE_PASSWORD, SPREADSHEET_NAME = "123", ""
+    EMPLOYEE_PASSWORD, SPREADSHEET_NAME, SPREADSHEET_KEY = "123", "", ""
+EMPLOYEE_PASSWORD_HASH = hashlib.sha256(str(EMPLOYEE_PASSWORD).encode()).digest()
 
 TIME_SLOTS = [
     ("09:00", "10:00"), ("10:00", "11:00"), ("11:00", "12:00"),
     ("13:30", "14:30"), ("14:30", "15:00")
 ]
 MAX_PER_SLOT, MAX_PER_DAY = 20, 100
+RECENT_FILES_LIMIT = 20
+PHOTO_MAX_SIZE = 800
+EXIF_ORIENTATION = 0x0112
+CONTEXT_KEYS = ("full_name", "type_of_study", "department", "section", "average", "appreciation", "rank", "total", "top_rank")
+_SLOT_STRINGS = tuple(f"{start}-{end}" for start, end in TIME_SLOTS)
 
-os.makedirs(PHOTO_DIR, exist_ok=True)
-os.makedirs(GENERATED_DOCS_DIR, exist_ok=True)
-os.makedirs(ID_CARD_DIR, exist_ok=True)
+_RE_AL = re.compile(r'^(ال)')
+_RE_TEH = re.compile(r'ة$')
+_RE_NONAR = re.compile(r'[^ا-ي\s]')
+_RE_WS = re.compile(r'\s+')
+_HAMZA_TRANS = str.maketrans('أإآ', 'ااا')
+_SAFE_NAME_RE = re.compile(r'\W+')
+
+@st.cache_resource(show_spinner=False)
+def ensure_dirs():
+    """Creates the working directories once per process rather than on every rerun."""
+    for directory in (GENERATED_DOCS_DIR, ID_CARD_DIR):
+        os.makedirs(directory, exist_ok=True)
+    return True
+
+ensure_dirs()
 
 # --- CORE FUNCTIONS ---
 
@@ -50,96 +70,189 @@ def get_gsheets_client():
         st.error(f"Failed to connect to Google Sheets. Check secrets. Error: {e}")
         return None
 
-@st.cache_data(ttl=300)
-def load_student_data(_gc_client):
+@st.cache_resource(show_spinner=False)
+def get_spreadsheet(_gc_client):
+    """Opens the configured spreadsheet once and reuses the handle."""
+    # Opening by key skips the Drive search that resolves a spreadsheet title
+    if SPREADSHEET_KEY: return _gc_client.open_by_key(SPREADSHEET_KEY)
+    return _gc_client.open(SPREADSHEET_NAME)
+
+@st.cache_resource(show_spinner=False)
+def get_worksheet(_gc_client, name):
+    return get_spreadsheet(_gc_client).worksheet(name)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_student_data(_gc_client):
+    """Reads the roster; errors are raised rather than cached so a transient failure is retried."""
+    worksheet = get_worksheet(_gc_client, "Sheet1")
+    values = worksheet.get_values()
+    df = pd.DataFrame(values[1:], columns=values[0]) if values else pd.DataFrame()
+    df = df.dropna(how="all")
+    name_to_index = {}
+    if 'full_name' in df.columns:
+        names = df['full_name'].astype("string")
+        # Blank cells come back as "" from get_values; skip them so they never become match candidates
+        names = names[names.notna() & names.str.strip().ne("")]
+        names = names.str.replace(_RE_AL, '', regex=True).str.translate(_HAMZA_TRANS)
+        names = names.str.replace(_RE_TEH, 'ه', regex=True).str.replace(_RE_NONAR, '', regex=True)
+        df['normalized_name_match'] = names.str.replace(_RE_WS, ' ', regex=True).str.strip()
+        for i, n in enumerate(df['normalized_name_match']):
+            if isinstance(n, str) and n: name_to_index.setdefault(n, i)
+    # Kept beside the frame rather than in df.attrs, which pandas deep-copies on every iloc
+    return df, tuple(name_to_index), name_to_index
+
+def load_student_data(gsheets_client):
     """Loads student data from the Google Sheet."""
-    if _gc_client is None: return None
+    if gsheets_client is None: return None
     try:
-        spreadsheet = _gc_client.open(SPREADSHEET_NAME)
-        worksheet = spreadsheet.worksheet("Sheet1")
-        df = pd.DataFrame(worksheet.get_all_records())
-        df = df.dropna(how="all")
-        if 'full_name' in df.columns:
-            df['normalized_name_match'] = df['full_name'].astype(str).apply(lambda x: normalize_arabic_name(x).replace(" ", ""))
-        return df
+        return fetch_student_data(gsheets_client)
     except Exception as e:
         st.error(f"Failed to read student data from Google Sheet. Error: {e}")
         return None
 
 def normalize_arabic_name(name):
     if not isinstance(name, str): return ""
-    name = re.sub(r'^(ال)', '', name)
-    name = re.sub(r'[أإآ]', 'ا', name)
-    name = re.sub(r'ة$', 'ه', name)
-    name = re.sub(r'[^ا-ي\s]', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _RE_AL.sub('', name)
+    name = name.translate(_HAMZA_TRANS)
+    name = _RE_TEH.sub('ه', name)
+    name = _RE_NONAR.sub('', name)
+    name = _RE_WS.sub(' ', name).strip()
     return name
 
-def match_name(input_name, df):
-    if df is None or 'normalized_name_match' not in df.columns: return None
-    normalized_input = normalize_arabic_name(input_name).replace(" ", "")
-    names = df['normalized_name_match'].dropna().tolist()
-    matches = process.extract(normalized_input, names, limit=1, score_cutoff=90, scorer=fuzz.partial_ratio)
-    if matches:
-        best_match_name = matches[0][0]
-        matched_row = df[df['normalized_name_match'] == best_match_name]
-        if not matched_row.empty:
-            return matched_row.iloc[0]
-    return None
+def match_name(input_name, roster):
+    from rapidfuzz import process, fuzz
+    if roster is None: return None
+    df, choices, name_to_index = roster
+    if 'normalized_name_match' not in df.columns: return None
+    normalized_input = normalize_arabic_name(input_name)
+    # Names copied from the official list usually match exactly; only fall back to fuzzy scoring on a miss
+    idx = name_to_index.get(normalized_input)
+    if idx is None:
+        match = process.extractOne(normalized_input, choices, scorer=fuzz.ratio, processor=None, score_cutoff=90)
+        if match:
+            idx = name_to_index.get(match[0])
+    return df.iloc[idx] if idx is not None else None
+
+def match_names_bulk(input_names, roster):
+    """Matches many names against the roster in one RapidFuzz cdist call."""
+    from rapidfuzz import process, fuzz
+    if roster is None or not input_names: return [None] * len(input_names)
+    df, choices, name_to_index = roster
+    if not choices: return [None] * len(input_names)
+    queries = [normalize_arabic_name(n) for n in input_names]
+    scores = process.cdist(queries, choices, scorer=fuzz.ratio, processor=None, score_cutoff=90, dtype=np.uint8, workers=-1)
+    best = scores.argmax(axis=1)
+    results = []
+    for row, col in enumerate(best):
+        idx = name_to_index.get(choices[col]) if scores[row, col] else None
+        results.append(df.iloc[idx] if idx is not None else None)
+    return results
+
+def count_appointments(log_df):
+    """Returns booking counts keyed by (date, slot) and by date."""
+    if log_df.empty: return {}, {}
+    slot_counts = log_df.groupby(['date', 'slot']).size().to_dict()
+    return slot_counts, log_df.groupby('date').size().to_dict()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_slot_counts(_gc_client):
+    """Counts Appointments bookings; cleared by log_appointment after each booking."""
+    worksheet = get_worksheet(_gc_client, "Appointments")
+    # Only the date and slot columns are needed; log_appointment writes [name, date, slot]
+    # A header-only sheet comes back as [[]], so drop blank rows before building the frame
+    rows = [row for row in worksheet.get_values("B2:C") if any(row)]
+    log_df = pd.DataFrame(rows, columns=["date", "slot"])
+    if not log_df.empty:
+        log_df = log_df.dropna(how="all")
+        log_df['date'] = pd.to_datetime(log_df['date'], format='%Y-%m-%d', cache=True).dt.date
+    return count_appointments(log_df)
 
 def get_available_slot(gsheets_client):
     if gsheets_client is None: return None, None
     try:
-        spreadsheet = gsheets_client.open(SPREADSHEET_NAME)
-        worksheet = spreadsheet.worksheet("Appointments")
-        records = worksheet.get_all_records()
-        log_df = pd.DataFrame(records)
-        if not log_df.empty:
-            log_df = log_df.dropna(how="all")
-            log_df['date'] = pd.to_datetime(log_df['date']).dt.date
+        slot_counts, day_totals = load_slot_counts(gsheets_client)
     except gspread.exceptions.WorksheetNotFound:
         st.error("The 'Appointments' tab was not found in your Google Sheet.")
         return None, None
     except Exception:
-        log_df = pd.DataFrame(columns=["name", "date", "slot"])
-    check_date = datetime.today().date() + timedelta(days=1)
+        slot_counts, day_totals = {}, {}
+    check_date = date.today() + timedelta(days=1)
     while True:
-        day_log = log_df[log_df['date'] == check_date] if not log_df.empty else pd.DataFrame()
-        if len(day_log) < MAX_PER_DAY:
-            for start, end in TIME_SLOTS:
-                slot = f"{start}-{end}"
-                slot_count = len(day_log[day_log['slot'] == slot]) if not day_log.empty else 0
-                if slot_count < MAX_PER_SLOT:
+        if day_totals.get(check_date, 0) < MAX_PER_DAY:
+            for slot in _SLOT_STRINGS:
+                if slot_counts.get((check_date, slot), 0) < MAX_PER_SLOT:
                     return slot, check_date
         check_date += timedelta(days=1)
 
-def log_appointment(gsheets_client, name, slot, date):
+def log_appointment(gsheets_client, name, slot, appointment_date):
     if gsheets_client is None: return
     try:
-        spreadsheet = gsheets_client.open(SPREADSHEET_NAME)
-        worksheet = spreadsheet.worksheet("Appointments")
-        worksheet.append_row([name, date.strftime('%Y-%m-%d'), slot])
+        worksheet = get_worksheet(gsheets_client, "Appointments")
+        worksheet.append_rows([[name, appointment_date.strftime('%Y-%m-%d'), slot]], value_input_option='RAW', insert_data_option='INSERT_ROWS')
+        load_slot_counts.clear()
     except Exception as e:
         st.error(f"Failed to save appointment. Error: {e}")
 
+@st.cache_resource(show_spinner=False)
+def load_template_bytes(path):
+    """Reads a certificate template once; each render parses a fresh copy."""
+    with open(path, "rb") as f:
+        return f.read()
+
+def safe_file_name(name):
+    return _SAFE_NAME_RE.sub('_', name).strip('_')
+
+def save_upload(uploaded_file, path):
+    uploaded_file.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(uploaded_file, f, 1024 * 1024)
+
 def generate_certificate(student_data, destination, grad_date, photo_file, gender):
+    # Only needed on submission, so keep them off the cold-start path of every other view
+    from docx.shared import Cm
+    from docxtpl import DocxTemplate, InlineImage
+    from docxtpl.richtext import RichText
+    from PIL import Image, ImageOps
     template_path = MALE_TEMPLATE if gender == "Male" else FEMALE_TEMPLATE
     try:
-        doc = DocxTemplate(template_path)
+        doc = DocxTemplate(io.BytesIO(load_template_bytes(template_path)))
     except Exception as e:
         st.error(f"Error loading template: {e}"); return None
-    def get_value(key): return "" if pd.isna(student_data.get(key)) else str(student_data[key])
+    values = {k: "" if pd.isna(v) else str(v) for k, v in student_data.items()}
     style_name = 'pt_bold heading'
+    safe_full_name = safe_file_name(values.get('full_name', ""))
     img = Image.open(photo_file)
-    safe_full_name = "".join(x for x in get_value('full_name') if x.isalnum())
-    img_path = os.path.join(PHOTO_DIR, f"{safe_full_name}_photo.png")
-    img.save(img_path)
+    ext = os.path.splitext(photo_file.name)[1].lower()
+    # JPEG EXIF is parsed from the header by Image.open; getexif() on a PNG would decode the whole image
+    rotated = ext in (".jpg", ".jpeg") and img.getexif().get(EXIF_ORIENTATION, 1) != 1
+    if ext in (".jpg", ".jpeg", ".png") and max(img.size) <= PHOTO_MAX_SIZE and not rotated:
+        # docx embeds JPEG/PNG as-is, so hand over the uploaded bytes
+        photo_file.seek(0)
+        image_stream = photo_file
+    else:
+        # The photo is printed at 3.5 x 4.5 cm, so full-resolution camera images only bloat the docx
+        img.draft('RGB', (PHOTO_MAX_SIZE, PHOTO_MAX_SIZE))
+        if rotated:
+            # Word does not reliably honor the EXIF orientation tag, so bake the rotation into the pixels
+            img = ImageOps.exif_transpose(img)
+        img.thumbnail((PHOTO_MAX_SIZE, PHOTO_MAX_SIZE), Image.LANCZOS)
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            # JPEG has no alpha, so flatten cut-out photos onto white instead of whatever sits under the mask
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        image_stream = io.BytesIO()
+        img.convert('RGB').save(image_stream, format='JPEG', quality=85)
+        image_stream.seek(0)
     
     # --- THIS IS THE FIX ---
     # Set both width and height to force the image to fit the container
-    image_for_template = InlineImage(doc, img_path, width=Cm(3.5), height=Cm(4.5))
+    image_for_template = InlineImage(doc, image_stream, width=Cm(3.5), height=Cm(4.5))
 
-    context = {'full_name': RichText(get_value("full_name"), style=style_name), 'type_of_study': RichText(get_value("type_of_study"), style=style_name), 'department': RichText(get_value("department"), style=style_name), 'section': RichText(get_value("section"), style=style_name), 'average': RichText(get_value("average"), style=style_name), 'appreciation': RichText(get_value("appreciation"), style=style_name), 'rank': RichText(get_value("rank"), style=style_name), 'total': RichText(get_value("total"), style=style_name), 'top_rank': RichText(get_value("top_rank"), style=style_name), 'destination': RichText(destination, style=style_name), 'grad_date': RichText(grad_date, style=style_name), 'photo': image_for_template}
+    rich_text = functools.partial(RichText, style=style_name)
+    context = {k: rich_text(values[k]) if values.get(k) else "" for k in CONTEXT_KEYS}
+    context.update({'destination': rich_text(destination), 'grad_date': rich_text(grad_date), 'photo': image_for_template})
     try:
         doc.render(context)
         file_name = f"{safe_full_name}_certificate.docx"
@@ -151,6 +264,7 @@ def generate_certificate(student_data, destination, grad_date, photo_file, gende
 
 # --- UI AND STYLING ---
 
+@st.cache_data(show_spinner=False)
 def get_image_as_base64(path):
     try:
         with open(path, "rb") as img_file:
@@ -159,7 +273,15 @@ def get_image_as_base64(path):
         st.error(f"Logo file not found: {path}.")
         return None
 
-def apply_custom_styling():
+@st.cache_data(show_spinner=False)
+def get_header_html():
+    logo_left_b64, logo_right_b64 = get_image_as_base64(LOGO_LEFT_PATH), get_image_as_base64(LOGO_RIGHT_PATH)
+    if logo_left_b64 and logo_right_b64:
+        return f'<div class="app-header"><img src="data:image/webp;base64,{logo_left_b64}"><h1>نظام طلب وثيقة التخرج</h1><img src="data:image/webp;base64,{logo_right_b64}"></div>'
+    return None
+
+@st.cache_data(show_spinner=False)
+def get_custom_css():
     primary_color = "#003366"
     secondary_color = "#D4AF37"
     background_color = "#F0F2F6"
@@ -167,7 +289,7 @@ def apply_custom_styling():
     sidebar_widget_color = "#B22222"
     light_primary = "#E0E7FF"
     form_bg_color = "#FFFFFF"
-    custom_css = f"""
+    return f"""
         <style>
             .app-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 2rem; }}
             .app-header h1 {{ color: {primary_color}; text-align: center; font-size: 2.5rem; margin: 0; }}
@@ -201,16 +323,18 @@ def apply_custom_styling():
             }}
         </style>
     """
-    st.markdown(custom_css, unsafe_allow_html=True)
-    logo_left_b64, logo_right_b64 = get_image_as_base64(LOGO_LEFT_PATH), get_image_as_base64(LOGO_RIGHT_PATH)
-    if logo_left_b64 and logo_right_b64:
-        st.markdown(f'<div class="app-header"><img src="data:image/webp;base64,{logo_left_b64}"><h1>نظام طلب وثيقة التخرج</h1><img src="data:image/webp;base64,{logo_right_b64}"></div>', unsafe_allow_html=True)
+
+def apply_custom_styling():
+    st.markdown(get_custom_css(), unsafe_allow_html=True)
+    header_html = get_header_html()
+    if header_html:
+        st.markdown(header_html, unsafe_allow_html=True)
 
 # --- PAGE RENDERING ---
 
 def render_student_view(gsheets_client):
-    student_df = load_student_data(gsheets_client)
-    if student_df is None:
+    roster = load_student_data(gsheets_client)
+    if roster is None:
         st.warning("Connecting to database... Check secrets if this persists.")
         return
 
@@ -234,26 +358,28 @@ def render_student_view(gsheets_client):
         if not all([name, destination, photo, id_card_front, id_card_back]):
             st.error("يرجى ملء جميع الحقول و إرفاق كافة الصور المطلوبة.")
             return
+        # Reject names that cannot match the roster before saving files or searching
+        normalized_name = normalize_arabic_name(name)
+        if len(normalized_name.split()) < 2 or len(normalized_name.replace(" ", "")) < 4:
+            st.error("يرجى كتابة الاسم الكامل باللغة العربية.")
+            return
         
-        with st.spinner("...جاري حفظ الملفات مؤقتاً"):
-            safe_name = re.sub(r'[^A-Za-z0-9ا-ي]', '_', name)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Save ID cards to a local (temporary) folder
-            id_card_front_bytes = id_card_front.getvalue()
-            id_filename_front = f"{safe_name}_{timestamp}_front.png"
-            id_filepath_front = os.path.join(ID_CARD_DIR, id_filename_front)
-            with open(id_filepath_front, "wb") as f:
-                f.write(id_card_front_bytes)
-
-            id_card_back_bytes = id_card_back.getvalue()
-            id_filename_back = f"{safe_name}_{timestamp}_back.png"
-            id_filepath_back = os.path.join(ID_CARD_DIR, id_filename_back)
-            with open(id_filepath_back, "wb") as f:
-                f.write(id_card_back_bytes)
-        
-        with st.spinner("...جاري البحث عن بيانات الطالب"):
-            matched_student = match_name(name, student_df)
+        safe_name = safe_file_name(name)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        id_filepath_front = os.path.join(ID_CARD_DIR, f"{safe_name}_{timestamp}_front.png")
+        id_filepath_back = os.path.join(ID_CARD_DIR, f"{safe_name}_{timestamp}_back.png")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Save ID cards to a local (temporary) folder while the roster is searched
+            pending_saves = [executor.submit(save_upload, id_card_front, id_filepath_front),
+                             executor.submit(save_upload, id_card_back, id_filepath_back)]
+
+            with st.spinner("...جاري البحث عن بيانات الطالب"):
+                matched_student = match_name(name, roster)
+
+            with st.spinner("...جاري حفظ الملفات مؤقتاً"):
+                for pending in pending_saves:
+                    pending.result()
 
         if matched_student is None:
             st.error("الاسم غير موجود في قاعدة البيانات.")
@@ -275,41 +401,72 @@ def render_student_view(gsheets_client):
                     appointment_date_str = appointment_date.strftime('%Y-%m-%d')
                     st.success(f"✅ تم تقديم طلبك بنجاح. موعدك للمراجعة هو: {slot} بتاريخ {appointment_date_str}")
 
-def render_employee_view():
+@st.cache_data(ttl=5, show_spinner=False)
+def list_dir(path):
+    """Lists the files in a directory, newest first."""
+    with os.scandir(path) as entries:
+        files = [(entry.stat().st_mtime, entry.name) for entry in entries if entry.is_file()]
+    return [name for _, name in sorted(files, reverse=True)]
+
+def render_download_buttons(directory, files):
+    """Shows the most recent files directly and tucks the rest into an expander."""
+    def download_button(file):
+        file_path = Path(directory, file)
+        st.download_button(label=f"Download {file}", data=file_path.read_bytes, file_name=file)
+    for file in files[:RECENT_FILES_LIMIT]:
+        download_button(file)
+    if len(files) > RECENT_FILES_LIMIT:
+        with st.expander(f"Show all ({len(files) - RECENT_FILES_LIMIT} more)"):
+            for file in files[RECENT_FILES_LIMIT:]:
+                download_button(file)
+
+@st.fragment
+def render_employee_files():
+    # Section for Generated Certificates
+    st.subheader("Generated Certificates")
+    try:
+        cert_files = list_dir(GENERATED_DOCS_DIR)
+        if not cert_files: 
+            st.info("No certificates have been generated in this session.")
+        else:
+            render_download_buttons(GENERATED_DOCS_DIR, cert_files)
+    except Exception as e: 
+        st.error(f"Could not read certificates directory: {e}")
+        
+    # Section for Uploaded ID Cards
+    st.subheader("Uploaded ID Cards")
+    try:
+        id_files = list_dir(ID_CARD_DIR)
+        if not id_files: 
+            st.info("No ID cards have been uploaded in this session.")
+        else:
+            render_download_buttons(ID_CARD_DIR, id_files)
+    except Exception as e: 
+        st.error(f"Could not read ID card directory: {e}")
+
+def render_employee_view(gsheets_client):
     st.header("Employee Dashboard")
     password = st.text_input("Enter Password", type="password", label_visibility="collapsed", placeholder="Enter Password")
-    if password == EMPLOYEE_PASSWORD:
+    if password and hmac.compare_digest(hashlib.sha256(password.encode()).digest(), EMPLOYEE_PASSWORD_HASH):
         st.success("Access Granted")
         
         st.warning("Note: Files listed below are temporary and will be deleted when the app restarts. Please download them daily.")
         
-        # Section for Generated Certificates
-        st.subheader("Generated Certificates")
-        try:
-            cert_files = os.listdir(GENERATED_DOCS_DIR)
-            if not cert_files: 
-                st.info("No certificates have been generated in this session.")
-            else:
-                for file in sorted(cert_files, reverse=True):
-                    file_path = os.path.join(GENERATED_DOCS_DIR, file)
-                    with open(file_path, "rb") as f:
-                        st.download_button(label=f"Download {file}", data=f, file_name=file)
-        except Exception as e: 
-            st.error(f"Could not read certificates directory: {e}")
-            
-        # Section for Uploaded ID Cards
-        st.subheader("Uploaded ID Cards")
-        try:
-            id_files = os.listdir(ID_CARD_DIR)
-            if not id_files: 
-                st.info("No ID cards have been uploaded in this session.")
-            else:
-                for file in sorted(id_files, reverse=True):
-                    file_path = os.path.join(ID_CARD_DIR, file)
-                    with open(file_path, "rb") as f:
-                        st.download_button(label=f"Download {file}", data=f, file_name=file)
-        except Exception as e: 
-            st.error(f"Could not read ID card directory: {e}")
+        render_employee_files()
+
+        # Section for bulk verification of queued names against the roster
+        st.subheader("Verify Student Names")
+        if st.button("Reload Student Data"):
+            fetch_student_data.clear()
+            st.success("Student data will be reloaded from the Google Sheet.")
+        names_text = st.text_area("Names to verify (one per line)")
+        if st.button("Verify Names") and names_text.strip():
+            input_names = [n.strip() for n in names_text.splitlines() if n.strip()]
+            matches = match_names_bulk(input_names, load_student_data(gsheets_client))
+            st.dataframe(pd.DataFrame({
+                "Entered Name": input_names,
+                "Matched Name": [m['full_name'] if m is not None else "Not found" for m in matches],
+            }), hide_index=True)
 
     elif password:
         st.error("Incorrect password.")
@@ -325,4 +482,4 @@ gsheets_client = get_gsheets_client()
 if app_mode == "Student Application":
     render_student_view(gsheets_client)
 elif app_mode == "Employee Dashboard":
-    render_employee_view()
+    render_employee_view(gsheets_client)